@@ -2,10 +2,12 @@ import os
 from typing import List
 from dotenv import load_dotenv
 from src.twitter_follower_monitor.bot import TwitterMonitorBot
+from src.twitter_follower_monitor.logging_config import setup_logging
 
 
 def main() -> None:
     load_dotenv()
+    setup_logging()
 
     authorized_users: List[str] = os.getenv("AUTHORIZED_USERS", "").split(",")
     authorized_users = [user.strip() for user in authorized_users if user.strip()]
@@ -19,7 +21,10 @@ def main() -> None:
         twitter_username=os.getenv("TWITTER_USERNAME", ""),
         twitter_password=os.getenv("TWITTER_PASSWORD", ""),
         authorized_users=authorized_users,
-        check_interval=int(os.getenv("CHECK_INTERVAL", "10"))
+        check_interval=int(os.getenv("CHECK_INTERVAL", "10")),
+        tab_count=int(os.getenv("TAB_COUNT", "1")),
+        debug_artifacts=os.getenv("DEBUG_ARTIFACTS", "").lower() in ("1", "true", "yes"),
+        artifact_sample_rate=float(os.getenv("DEBUG_ARTIFACT_SAMPLE_RATE", "0"))
     )
     
     bot.run()
@@ -0,0 +1,125 @@
+import gzip
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+
+class ArtifactRecorder:
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 0.0,
+        directory: str = "debug_artifacts",
+        max_files: int = 20,
+        max_bytes: int = 2 * 1024 * 1024,
+        queue_size: int = 8,
+        failure_cooldown: float = 600.0,
+        min_failure_interval: float = 30.0
+    ) -> None:
+
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.failure_cooldown = failure_cooldown
+        self.min_failure_interval = min_failure_interval
+        self._last_failure_by_name: Dict[str, float] = {}
+        self._last_failure: Optional[float] = None
+        self._queue: "queue.Queue[Tuple[str, str]]" = queue.Queue(maxsize=queue_size)
+        self._files: Deque[Path] = deque()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+    @property
+    def chrome_log_path(self) -> Optional[Path]:
+        if not self.enabled:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / "chrome.log"
+
+    def capture_stage(self, name: str, source: Callable[[], str]) -> None:
+        if self.enabled and self.sample_rate > 0 and random.random() < self.sample_rate:
+            self._capture(name, source)
+
+    def capture_failure(self, name: str, source: Callable[[], str]) -> None:
+        if not self.enabled:
+            return
+
+        # A burst of failures (e.g. rate limiting) must not turn into a
+        # page_source fetch per check, so failures are throttled globally
+        # and per artifact name.
+        now = time.monotonic()
+        if self._last_failure is not None and now - self._last_failure < self.min_failure_interval:
+            return
+        last_for_name = self._last_failure_by_name.get(name)
+        if last_for_name is not None and now - last_for_name < self.failure_cooldown:
+            return
+
+        if self._capture(name, source):
+            self._last_failure = now
+            self._last_failure_by_name[name] = now
+
+    def _capture(self, name: str, source: Callable[[], str]) -> bool:
+        # Check for room before fetching: page_source is the expensive part.
+        if self._queue.full():
+            logging.warning(f"Debug artifact queue full, skipping {name}")
+            return False
+
+        try:
+            content = source()
+        except Exception as e:
+            logging.warning(f"Could not capture debug artifact {name}: {str(e)}")
+            return False
+
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((name, content))
+        except queue.Full:
+            logging.warning(f"Debug artifact queue full, dropping {name}")
+            return False
+        return True
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer and self._writer.is_alive():
+                return
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._files = deque(sorted(self.directory.glob("*.html.gz")))
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            name, content = self._queue.get()
+            try:
+                self._write(name, content)
+            except Exception as e:
+                logging.error(f"Failed to write debug artifact {name}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, name: str, content: str) -> None:
+        data = content.encode("utf-8", errors="replace")[:self.max_bytes]
+        name = re.sub(r"[^A-Za-z0-9_-]", "_", name)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = self.directory / f"{timestamp}_{name}.html.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(data)
+
+        self._files.append(path)
+        while len(self._files) > self.max_files:
+            oldest = self._files.popleft()
+            try:
+                oldest.unlink()
+            except FileNotFoundError:
+                pass
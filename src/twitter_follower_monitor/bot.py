@@ -1,15 +1,23 @@
 import threading
-from typing import Optional, List
-from telegram import Update, Chat
+from typing import TYPE_CHECKING, Optional, List
+from telegram import Update, Chat, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
 from telegram.ext import (
     Application,
+    CallbackQueryHandler,
     CommandHandler,
     ContextTypes
 )
 
-from .monitor import FollowerMonitor
 from .database import DatabaseManager
 from .notifications import TelegramNotifier
+from .artifacts import ArtifactRecorder
+from .read_model import UserReadModel
+
+if TYPE_CHECKING:
+    from .monitor import FollowerMonitor
+
+LIST_USERS_CALLBACK_PREFIX = "list_users:"
 
 
 class TwitterMonitorBot:
@@ -21,7 +29,10 @@ class TwitterMonitorBot:
         twitter_email: str,
         twitter_password: str,
         authorized_users: List[str],
-        check_interval: int = 300
+        check_interval: int = 300,
+        tab_count: int = 1,
+        debug_artifacts: bool = False,
+        artifact_sample_rate: float = 0.0
     ) -> None:
 
         self.telegram_token = telegram_token
@@ -29,12 +40,18 @@ class TwitterMonitorBot:
         self.twitter_email = twitter_email
         self.twitter_password = twitter_password
         self.check_interval = check_interval
+        self.tab_count = tab_count
         self.authorized_users = set(authorized_users)  
         
         self.db_manager = DatabaseManager()
+        self.read_model = UserReadModel(self.db_manager)
+        self.artifact_recorder = ArtifactRecorder(
+            enabled=debug_artifacts,
+            sample_rate=artifact_sample_rate
+        )
         self.monitor_thread: Optional[threading.Thread] = None
-        self.monitor: Optional[FollowerMonitor] = None
-        self.chat_id: Optional[int] = None
+        self.monitor: Optional["FollowerMonitor"] = None
+        self.notifier: Optional[TelegramNotifier] = None
 
     async def _check_auth(self, update: Update) -> bool:
 
@@ -52,24 +69,59 @@ class TwitterMonitorBot:
 
         return True
 
+    async def _check_callback_auth(self, update: Update) -> bool:
+        query = update.callback_query
+        username = update.effective_user.username if update.effective_user else None
+        if not update.effective_chat or not username or username not in self.authorized_users:
+            await query.answer("You are not authorized to use this bot!")
+            return False
+
+        return True
+
+    def _list_users_keyboard(self, page: int, total_pages: int) -> Optional[InlineKeyboardMarkup]:
+        if total_pages <= 1:
+            return None
+
+        buttons = []
+        if page > 0:
+            buttons.append(InlineKeyboardButton(
+                "« Prev", callback_data=f"{LIST_USERS_CALLBACK_PREFIX}{page - 1}"
+            ))
+        if page < total_pages - 1:
+            buttons.append(InlineKeyboardButton(
+                "Next »", callback_data=f"{LIST_USERS_CALLBACK_PREFIX}{page + 1}"
+            ))
+        return InlineKeyboardMarkup([buttons])
+
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if not await self._check_auth(update):
             return
 
-        self.chat_id = update.effective_chat.id
-        notifier = TelegramNotifier(context.bot, self.chat_id)
+        chat_id = update.effective_chat.id
+        adopted_users = self.db_manager.subscribe_orphaned_users(chat_id)
+        if adopted_users:
+            users_list = ", ".join(f"@{user}" for user in adopted_users)
+            await update.message.reply_text(f"Subscribed this chat to unassigned users: {users_list}")
+
+        if self.notifier is None:
+            self.notifier = TelegramNotifier(context.bot)
         
         if self.monitor_thread and self.monitor_thread.is_alive():
             await update.message.reply_text("Monitoring is already running!")
             return
 
+        # Imported here so commands that never scrape don't load selenium.
+        from .monitor import FollowerMonitor
+
         self.monitor = FollowerMonitor(
-            notifier=notifier,
+            notifier=self.notifier,
             check_interval=self.check_interval,
             twitter_username=self.twitter_username,
             twitter_email=self.twitter_email,
             twitter_password=self.twitter_password,
-            db_manager=self.db_manager
+            db_manager=self.db_manager,
+            tab_count=self.tab_count,
+            artifact_recorder=self.artifact_recorder
         )
 
         usernames = self.db_manager.get_all_users()
@@ -109,13 +161,14 @@ class TwitterMonitorBot:
             await update.message.reply_text("Please provide one or more usernames!")
             return
 
+        chat_id = update.effective_chat.id
         added_users = []
         failed_users = []
 
         for username in context.args:
-            username = username.strip('@')
+            username = username.strip('@').lower()
             try:
-                self.db_manager.add_user(username)
+                self.db_manager.subscribe(chat_id, username)
                 added_users.append(username)
             except Exception as e:
                 failed_users.append(username)
@@ -143,18 +196,18 @@ class TwitterMonitorBot:
             await update.message.reply_text("Please provide one or more usernames!")
             return
 
-        existing_users = self.db_manager.get_all_users()
+        chat_id = update.effective_chat.id
         for username in context.args:
-            if username.strip('@') not in existing_users:
-                await update.message.reply_text(f"User @{username} does not exist in the database.")
+            if not self.read_model.is_subscribed(chat_id, username.strip('@').lower()):
+                await update.message.reply_text(f"User @{username} is not monitored in this chat.")
                 return
         removed_users = []
         failed_users = []
 
         for username in context.args:
-            username = username.strip('@')
+            username = username.strip('@').lower()
             try:
-                self.db_manager.remove_user(username)
+                self.db_manager.unsubscribe(chat_id, username)
                 removed_users.append(username)
             except Exception as e:
                 failed_users.append(username)
@@ -179,12 +232,41 @@ class TwitterMonitorBot:
         if not await self._check_auth(update):
             return
 
-        users = self.db_manager.get_all_users()
-        if users:
-            user_list = "\n".join(f"@{user}" for user in users)
-            await update.message.reply_text(f"Monitored users:\n{user_list}")
+        text, page, total_pages = self.read_model.render_user_list(update.effective_chat.id)
+        if text:
+            await update.message.reply_text(
+                text,
+                reply_markup=self._list_users_keyboard(page, total_pages)
+            )
+        else:
+            await update.message.reply_text("No users are being monitored in this chat!")
+
+    async def list_users_page(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        if not await self._check_callback_auth(update):
+            return
+
+        query = update.callback_query
+        requested_page = int(query.data[len(LIST_USERS_CALLBACK_PREFIX):])
+        text, page, total_pages = self.read_model.render_user_list(
+            update.effective_chat.id, requested_page
+        )
+        await query.answer()
+
+        if not text:
+            text = "No users are being monitored in this chat!"
+            reply_markup = None
         else:
-            await update.message.reply_text("No users are being monitored!")
+            reply_markup = self._list_users_keyboard(page, total_pages)
+
+        current_markup = query.message.reply_markup if query.message else None
+        if query.message and query.message.text == text and current_markup == reply_markup:
+            return
+
+        try:
+            await query.edit_message_text(text, reply_markup=reply_markup)
+        except BadRequest as e:
+            if "message is not modified" not in str(e).lower():
+                raise
 
     async def get_following(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if not await self._check_auth(update):
@@ -194,10 +276,10 @@ class TwitterMonitorBot:
             await update.message.reply_text("Please provide a username!")
             return
 
-        username = context.args[0].strip('@')
+        username = context.args[0].strip('@').lower()
         
         try:
-            count = self.db_manager.get_following_count(username)
+            count = self.read_model.get_following_count(username)
             if count is not None:
                 await update.message.reply_text(
                     f"@{username} is currently following {count} accounts"
@@ -219,9 +301,9 @@ Available commands:
 
 /start - Start monitoring Twitter followers
 /stop - Stop monitoring Twitter followers
-/add_user username1 username2 ... - Add one or more users to monitor
-/remove_user username1 username2 ... - Remove one or more users from monitoring
-/list_users - Show all monitored users
+/add_user username1 username2 ... - Subscribe this chat to one or more users
+/remove_user username1 username2 ... - Unsubscribe this chat from one or more users
+/list_users - Show users monitored in this chat
 /get_following username - Get current following count for a user
 /help - Show this help message
 
@@ -240,6 +322,9 @@ Examples:
         application.add_handler(CommandHandler("add_user", self.add_user))
         application.add_handler(CommandHandler("remove_user", self.remove_user))
         application.add_handler(CommandHandler("list_users", self.list_users))
+        application.add_handler(CallbackQueryHandler(
+            self.list_users_page, pattern=rf"^{LIST_USERS_CALLBACK_PREFIX}\d+$"
+        ))
         application.add_handler(CommandHandler("get_following", self.get_following))
         application.add_handler(CommandHandler("help", self.help))
 
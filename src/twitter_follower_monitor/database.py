@@ -1,5 +1,17 @@
 import sqlite3
-from typing import List, Optional
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+SUBSCRIPTIONS_CHANGED = "subscriptions"
+USER_REMOVED = "user_removed"
+FOLLOWING_CHANGED = "following"
+
+
+class ChangeEvent(NamedTuple):
+    kind: str
+    chat_id: Optional[int] = None
+    username: Optional[str] = None
+    count: Optional[int] = None
 
 
 class DatabaseManager:
@@ -7,7 +19,11 @@ class DatabaseManager:
     def __init__(self, db_path: str = "twitter_monitor.db") -> None:
 
         self.db_path = db_path
+        self._subscribers: Dict[str, Set[int]] = {}
+        self._subscribers_lock = threading.Lock()
+        self._listeners: List[Callable[[ChangeEvent], None]] = []
         self._init_db()
+        self._load_subscriptions()
 
     def _init_db(self) -> None:
         with sqlite3.connect(self.db_path) as conn:
@@ -19,28 +35,144 @@ class DatabaseManager:
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS subscriptions (
+                    chat_id INTEGER NOT NULL,
+                    username TEXT NOT NULL,
+                    PRIMARY KEY (chat_id, username)
+                )
+            """)
+            # Usernames are stored lowercased so each account is scraped once
+            # regardless of how chats spell it; fold any older mixed-case rows.
+            cursor.execute("UPDATE OR IGNORE monitored_users SET username = lower(username)")
+            cursor.execute("""
+                UPDATE monitored_users
+                SET following_count = COALESCE(following_count, (
+                        SELECT other.following_count FROM monitored_users AS other
+                        WHERE lower(other.username) = monitored_users.username
+                            AND other.username != monitored_users.username
+                            AND other.following_count IS NOT NULL
+                        ORDER BY other.last_updated DESC
+                        LIMIT 1
+                    )),
+                    last_updated = CASE WHEN following_count IS NULL THEN COALESCE((
+                        SELECT other.last_updated FROM monitored_users AS other
+                        WHERE lower(other.username) = monitored_users.username
+                            AND other.username != monitored_users.username
+                            AND other.following_count IS NOT NULL
+                        ORDER BY other.last_updated DESC
+                        LIMIT 1
+                    ), last_updated) ELSE last_updated END
+                WHERE username = lower(username)
+            """)
+            cursor.execute("DELETE FROM monitored_users WHERE username != lower(username)")
+            cursor.execute("UPDATE OR IGNORE subscriptions SET username = lower(username)")
+            cursor.execute("DELETE FROM subscriptions WHERE username != lower(username)")
             conn.commit()
 
-    def add_user(self, username: str) -> None:
+    def _load_subscriptions(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT chat_id, username FROM subscriptions")
+            rows = cursor.fetchall()
+
+        with self._subscribers_lock:
+            self._subscribers = {}
+            for chat_id, username in rows:
+                self._subscribers.setdefault(username, set()).add(chat_id)
 
+    def add_change_listener(self, listener: Callable[[ChangeEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def _notify_change(self, event: ChangeEvent) -> None:
+        for listener in self._listeners:
+            listener(event)
+
+    def subscribe(self, chat_id: int, username: str) -> None:
+
+        username = username.lower()
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "INSERT OR IGNORE INTO monitored_users (username) VALUES (?)",
                 (username,)
             )
+            cursor.execute(
+                "INSERT OR IGNORE INTO subscriptions (chat_id, username) VALUES (?, ?)",
+                (chat_id, username)
+            )
             conn.commit()
 
-    def remove_user(self, username: str) -> None:
+        with self._subscribers_lock:
+            self._subscribers.setdefault(username, set()).add(chat_id)
+        self._notify_change(ChangeEvent(SUBSCRIPTIONS_CHANGED, chat_id=chat_id, username=username))
 
+    def unsubscribe(self, chat_id: int, username: str) -> None:
+
+        username = username.lower()
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "DELETE FROM monitored_users WHERE username = ?",
+                "DELETE FROM subscriptions WHERE chat_id = ? AND username = ?",
+                (chat_id, username)
+            )
+            cursor.execute(
+                "SELECT 1 FROM subscriptions WHERE username = ? LIMIT 1",
                 (username,)
             )
+            user_removed = cursor.fetchone() is None
+            if user_removed:
+                cursor.execute(
+                    "DELETE FROM monitored_users WHERE username = ?",
+                    (username,)
+                )
+            conn.commit()
+
+        with self._subscribers_lock:
+            chats = self._subscribers.get(username)
+            if chats is not None:
+                chats.discard(chat_id)
+                if not chats:
+                    del self._subscribers[username]
+        self._notify_change(ChangeEvent(SUBSCRIPTIONS_CHANGED, chat_id=chat_id, username=username))
+        if user_removed:
+            self._notify_change(ChangeEvent(USER_REMOVED, username=username))
+
+    def subscribe_orphaned_users(self, chat_id: int) -> List[str]:
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT username FROM monitored_users
+                WHERE username NOT IN (SELECT username FROM subscriptions)
+                """
+            )
+            orphans = [row[0] for row in cursor.fetchall()]
+            cursor.executemany(
+                "INSERT OR IGNORE INTO subscriptions (chat_id, username) VALUES (?, ?)",
+                [(chat_id, username) for username in orphans]
+            )
             conn.commit()
 
+        with self._subscribers_lock:
+            for username in orphans:
+                self._subscribers.setdefault(username, set()).add(chat_id)
+        if orphans:
+            self._notify_change(ChangeEvent(SUBSCRIPTIONS_CHANGED, chat_id=chat_id))
+        return orphans
+
+    def get_subscribers(self, username: str) -> Set[int]:
+        with self._subscribers_lock:
+            return set(self._subscribers.get(username.lower(), ()))
+
+    def get_chat_users(self, chat_id: int) -> List[str]:
+        with self._subscribers_lock:
+            return [
+                username for username, chats in self._subscribers.items()
+                if chat_id in chats
+            ]
+
     def get_all_users(self) -> List[str]:
 
         with sqlite3.connect(self.db_path) as conn:
@@ -51,6 +183,11 @@ class DatabaseManager:
     def update_follower_count(self, username: str, count: int) -> None:
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.execute(
+                "SELECT following_count FROM monitored_users WHERE username = ?",
+                (username,)
+            )
+            previous = cursor.fetchone()
             cursor.execute(
                 """
                 UPDATE monitored_users 
@@ -61,6 +198,15 @@ class DatabaseManager:
             )
             conn.commit() 
 
+        if previous is not None and previous[0] != count:
+            self._notify_change(ChangeEvent(FOLLOWING_CHANGED, username=username, count=count))
+
+    def get_all_following_counts(self) -> Dict[str, Optional[int]]:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT username, following_count FROM monitored_users")
+            return dict(cursor.fetchall())
+
     def get_following_count(self, username: str) -> Optional[int]:
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
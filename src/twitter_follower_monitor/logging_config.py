@@ -0,0 +1,31 @@
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+_configured = False
+
+
+def setup_logging(log_dir: str = "logs", max_bytes: int = 5 * 1024 * 1024, backup_count: int = 5) -> None:
+    global _configured
+    if _configured:
+        return
+
+    log_path = Path(log_dir)
+    log_path.mkdir(exist_ok=True)
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            RotatingFileHandler(
+                log_path / "monitor.log",
+                maxBytes=max_bytes,
+                backupCount=backup_count
+            ),
+            logging.StreamHandler()
+        ]
+    )
+    _configured = True
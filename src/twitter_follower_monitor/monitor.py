@@ -2,37 +2,25 @@ import time
 import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
-
-def setup_logging() -> None:
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    log_file = log_dir / f"monitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+from typing import Iterator, List, Dict, Optional, Union
 
 from selenium import webdriver
+from selenium.common.exceptions import JavascriptException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from .artifacts import ArtifactRecorder
 from .notifications import NotificationService
 from .database import DatabaseManager
 from bs4 import BeautifulSoup
 
+
+class LoginFailedError(Exception):
+    pass
+
+
 class FollowerMonitor:
 
     def __init__(
@@ -42,7 +30,9 @@ class FollowerMonitor:
         twitter_email: str,
         twitter_username: str,
         twitter_password: str,
-        db_manager: DatabaseManager
+        db_manager: DatabaseManager,
+        tab_count: int = 1,
+        artifact_recorder: Optional[ArtifactRecorder] = None
     ) -> None:
 
         self.notifier = notifier
@@ -51,6 +41,9 @@ class FollowerMonitor:
         self.twitter_username = twitter_username
         self.twitter_password = twitter_password
         self.db_manager = db_manager
+        self.tab_count = max(1, tab_count)
+        self._tab_handles: List[str] = []
+        self.artifact_recorder = artifact_recorder or ArtifactRecorder()
         self._known_follows: Dict[str, int] = {}
         self._is_running: bool = False
         self.cookies_file = Path("twitter_cookies.json")
@@ -60,7 +53,6 @@ class FollowerMonitor:
         self._normal_login_attempts = 0
         self._cookie_login_attempts = 0
         self._normal_login_failures = 0
-        setup_logging()
 
     def _save_cookies(self, driver: webdriver.Chrome) -> None:
         cookies = driver.get_cookies()
@@ -71,13 +63,13 @@ class FollowerMonitor:
         if not self.cookies_file.exists():
             return False
         
-        driver.get("https://twitter.com")
+        self._load_page(driver, "https://twitter.com")
         try:
             with open(self.cookies_file) as f:
                 cookies = json.load(f)
                 for cookie in cookies:
                     driver.add_cookie(cookie)
-            driver.refresh()
+            self._load_page(driver)
             return "login" not in driver.current_url
         except Exception as e:
             print(f"Error loading cookies: {e}")
@@ -95,10 +87,9 @@ class FollowerMonitor:
         #    return
 
         print("Logging into Twitter...")
-        driver.get("https://twitter.com/login")
+        self._load_page(driver, "https://twitter.com/login")
         time.sleep(5)
-        with open("login_page_initial.html", "w", encoding='utf-8') as f:
-            f.write(driver.page_source)
+        self.artifact_recorder.capture_stage("login_page_initial", lambda: driver.page_source)
         
         wait = WebDriverWait(driver, 10)
 
@@ -107,16 +98,14 @@ class FollowerMonitor:
         email_field.send_keys(Keys.RETURN)
         
         time.sleep(2)
-        with open("login_page_after_username.html", "w", encoding='utf-8') as f:
-            f.write(driver.page_source)
+        self.artifact_recorder.capture_stage("login_page_after_username", lambda: driver.page_source)
         
         try:
             username_field = wait.until(EC.presence_of_element_located((By.NAME, "text")))
             username_field.send_keys(self.twitter_email.split('@')[0])
             username_field.send_keys(Keys.RETURN)
             time.sleep(2)
-            with open("login_page_after_email.html", "w", encoding='utf-8') as f:
-                f.write(driver.page_source)
+            self.artifact_recorder.capture_stage("login_page_after_email", lambda: driver.page_source)
         except:
             pass
 
@@ -125,12 +114,10 @@ class FollowerMonitor:
         password_field.send_keys(Keys.RETURN)
 
         time.sleep(5)
-        with open("login_page_after_password.html", "w", encoding='utf-8') as f:
-            f.write(driver.page_source)
+        self.artifact_recorder.capture_stage("login_page_after_password", lambda: driver.page_source)
         
         if "login" in driver.current_url:
-            with open("login_failed_page.html", "w", encoding='utf-8') as f:
-                f.write(driver.page_source)
+            self.artifact_recorder.capture_failure("login_failed_page", lambda: driver.page_source)
             self._normal_login_failures += 1
             logging.warning(f"Normal login failed. Total failures: {self._normal_login_failures}")
             
@@ -140,15 +127,17 @@ class FollowerMonitor:
                 return
             else:
                 logging.error("Both normal login and cookie login failed")
-                raise Exception("All login attempts failed")
+                raise LoginFailedError("All login attempts failed")
         
         logging.info("Normal login successful")
         self._save_cookies(driver)
 
     def _get_following(self, driver: webdriver.Chrome, username: str) -> int:
         print(f"Navigating to https://twitter.com/{username}'s profile page")
-        driver.get(f"https://twitter.com/{username}")
-        
+        self._load_page(driver, f"https://twitter.com/{username}")
+        return self._read_following_count(driver, username)
+
+    def _read_following_count(self, driver: webdriver.Chrome, username: str) -> int:
         try:
             wait = WebDriverWait(driver, 10)
             following_xpath = "(//div[contains(@class, 'r-1rtiivn')])[1]"
@@ -162,13 +151,115 @@ class FollowerMonitor:
 
             return int(following_count_clean)
         except Exception as e:
+            self.artifact_recorder.capture_failure(f"following_failed_{username}", lambda: driver.page_source)
             raise Exception(f"Failed to get following count for @{username}. Account may not exist or be private: {str(e)}")
 
+    def _ensure_tabs(self, driver: webdriver.Chrome) -> List[str]:
+        open_handles = set(driver.window_handles)
+        self._tab_handles = [handle for handle in self._tab_handles if handle in open_handles]
+        if not self._tab_handles:
+            self._tab_handles = [driver.current_window_handle]
+
+        while len(self._tab_handles) < self.tab_count:
+            driver.switch_to.new_window('tab')
+            self._tab_handles.append(driver.current_window_handle)
+
+        return self._tab_handles
+
+    def _wait_for_fresh_document(self, driver: webdriver.Chrome, ready_states: str) -> None:
+        # The marker set before navigating only disappears once the new
+        # document has replaced the old one; script errors while the old
+        # document is being torn down are retried.
+        WebDriverWait(driver, 30, ignored_exceptions=(JavascriptException,)).until(
+            lambda d: d.execute_script(
+                f"return !window.__followerMonitorStale && {ready_states};"
+            )
+        )
+
+    def _load_page(self, driver: webdriver.Chrome, url: Optional[str] = None) -> None:
+        # Multi-tab mode runs with the 'none' page load strategy so navigations
+        # in other tabs don't block; single-page loads wait for completion here.
+        if self.tab_count > 1:
+            driver.execute_script("window.__followerMonitorStale = true;")
+
+        if url is None:
+            driver.refresh()
+        else:
+            driver.get(url)
+
+        if self.tab_count > 1:
+            self._wait_for_fresh_document(driver, "document.readyState === 'complete'")
+
+    def _get_following_multiplexed(self, driver: webdriver.Chrome, usernames: List[str]) -> Dict[str, Union[int, Exception]]:
+        # Kick off every navigation without waiting for page load, then visit
+        # each tab in turn to harvest the count once its page has committed.
+        tabs = self._ensure_tabs(driver)
+        results: Dict[str, Union[int, Exception]] = {}
+        started = time.monotonic()
+        try:
+            for handle, username in zip(tabs, usernames):
+                print(f"Navigating to https://twitter.com/{username}'s profile page in a background tab")
+                driver.switch_to.window(handle)
+                driver.execute_script(
+                    "window.__followerMonitorStale = true; window.location.href = arguments[0];",
+                    f"https://twitter.com/{username}"
+                )
+
+            for handle, username in zip(tabs, usernames):
+                try:
+                    driver.switch_to.window(handle)
+                    self._wait_for_fresh_document(driver, "document.readyState !== 'loading'")
+                    results[username] = self._read_following_count(driver, username)
+                except Exception as e:
+                    results[username] = e
+        finally:
+            driver.switch_to.window(tabs[0])
+
+        logging.info(
+            f"Checked {len(usernames)} accounts across {len(tabs)} tabs "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return results
+
+    def _get_following_counts(self, driver: webdriver.Chrome, usernames: List[str]) -> Dict[str, Union[int, Exception]]:
+        if self.tab_count > 1 and len(usernames) > 1:
+            try:
+                return self._get_following_multiplexed(driver, usernames)
+            except Exception as e:
+                # A batch-level failure (e.g. a tab that went away) says nothing
+                # about the individual accounts, so retry them one by one in the
+                # main tab instead of failing the whole batch.
+                logging.warning(f"Multi-tab check failed, retrying batch sequentially: {str(e)}")
+                try:
+                    driver.switch_to.window(driver.window_handles[0])
+                except:
+                    pass
+
+        results: Dict[str, Union[int, Exception]] = {}
+        started = time.monotonic()
+        for username in usernames:
+            try:
+                results[username] = self._get_following(driver, username)
+            except Exception as e:
+                results[username] = e
+        logging.info(f"Checked {len(usernames)} accounts in 1 tab in {time.monotonic() - started:.1f}s")
+        return results
+
+    def _take_count(self, counts: Dict[str, Union[int, Exception]], username: str) -> int:
+        result = counts[username]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _batches(self, usernames: List[str]) -> Iterator[List[str]]:
+        for start in range(0, len(usernames), self.tab_count):
+            yield usernames[start:start + self.tab_count]
+
     def _get_latest_follow(self, driver: webdriver.Chrome, username: str) -> Optional[str]:
         for attempt in range(2):
             try:
                 logging.info(f"Checking latest follow for @{username} - XPath attempt {attempt + 1}")
-                driver.get(f"https://twitter.com/{username}/following")
+                self._load_page(driver, f"https://twitter.com/{username}/following")
                 time.sleep(5)  
 
                 xpath = '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div[1]/div/section/div/div/div[1]/div/div/button/div/div[2]/div[1]/div[1]/div/div[2]/div/a/div/div/span'
@@ -192,7 +283,7 @@ class FollowerMonitor:
             if result:
                 return result
             if attempt < 1:
-                driver.refresh()
+                self._load_page(driver)
                 time.sleep(3)
         
         return None
@@ -233,10 +324,17 @@ class FollowerMonitor:
         options.add_argument('--proxy-bypass-list=*')
         options.add_argument('--start-maximized')
         options.add_argument('--disable-blink-features=AutomationControlled')
+        if self.tab_count > 1:
+            options.page_load_strategy = 'none'
+            options.add_argument('--disable-background-timer-throttling')
+            options.add_argument('--disable-backgrounding-occluded-windows')
+            options.add_argument('--disable-renderer-backgrounding')
         
-        service = webdriver.ChromeService(
-            service_args=['--verbose', '--log-path=chrome.log']
-        )
+        service_args = []
+        chrome_log_path = self.artifact_recorder.chrome_log_path
+        if chrome_log_path:
+            service_args = ['--log-level=WARNING', f'--log-path={chrome_log_path}']
+        service = webdriver.ChromeService(service_args=service_args)
         
         driver = webdriver.Chrome(
             service=service,
@@ -245,11 +343,15 @@ class FollowerMonitor:
         
         driver.set_page_load_timeout(30)
         driver.set_script_timeout(30)
+        self._tab_handles = []
         
         try:
             self._login(driver)
             return driver
         except Exception as e:
+            # LoginFailedError already captured login_failed_page in _login.
+            if not isinstance(e, LoginFailedError):
+                self.artifact_recorder.capture_failure("login_error", lambda: driver.page_source)
             try:
                 driver.quit()
             except:
@@ -301,6 +403,18 @@ class FollowerMonitor:
         logging.critical("Failed to restart Chrome driver after 3 attempts")
         raise Exception("Failed to restart Chrome driver after 3 attempts")
 
+    def _notify_subscribers(self, username: str, message: str) -> None:
+        chat_ids = self.db_manager.get_subscribers(username)
+        if not chat_ids:
+            logging.info(f"No chats subscribed to @{username}, dropping notification")
+            return
+
+        for chat_id in chat_ids:
+            try:
+                self.notifier.notify(chat_id, message)
+            except Exception as e:
+                logging.error(f"Failed to notify chat {chat_id} about @{username}: {str(e)}")
+
     def stop_monitoring(self) -> None:
         self._is_running = False
         logging.info(f"""Monitoring stopped. Statistics:
@@ -316,71 +430,78 @@ class FollowerMonitor:
         try:
             print("Login successful!")
 
-            for username in usernames:
-                try:
-                    time.sleep(self.check_interval)
-                    self._known_follows[username] = self._get_following(driver, username)
-                    print(f"Initial following count for {username}: {self._known_follows[username]}")
-                    self._consecutive_errors = 0
-                except Exception as e:
-                    print(f"Failed to get initial count for {username}: {str(e)}")
-                    self._consecutive_errors += 1
-                    if self._consecutive_errors >= self._max_consecutive_errors:
-                        driver = self._restart_driver(driver)
+            for batch in self._batches(usernames):
+                time.sleep(self.check_interval)
+                counts = self._get_following_counts(driver, batch)
+                for username in batch:
+                    try:
+                        self._known_follows[username] = self._take_count(counts, username)
+                        print(f"Initial following count for {username}: {self._known_follows[username]}")
                         self._consecutive_errors = 0
-                    continue
+                    except Exception as e:
+                        print(f"Failed to get initial count for {username}: {str(e)}")
+                        self._consecutive_errors += 1
+                        if self._consecutive_errors >= self._max_consecutive_errors:
+                            driver = self._restart_driver(driver)
+                            self._consecutive_errors = 0
+                        continue
             
             while self._is_running:
                 try:
                     current_usernames = self.db_manager.get_all_users()
                     
-                    for username in current_usernames:
+                    for batch in self._batches(current_usernames):
                         time.sleep(self.check_interval)
-                        try:
-                            if username not in self._known_follows:
-                                try:
-                                    self._known_follows[username] = self._get_following(driver, username)
-                                    print(f"New user added - Initial following count for {username}: {self._known_follows[username]}")
-                                    self._consecutive_errors = 0
-                                    continue
-                                except Exception as e:
-                                    print(f"Failed to get initial count for new user {username}: {str(e)}")
-                                    self._consecutive_errors += 1
-                                    if self._consecutive_errors >= self._max_consecutive_errors:
-                                        driver = self._restart_driver(driver)
+                        counts = self._get_following_counts(driver, batch)
+                        for username in batch:
+                            try:
+                                if username not in self._known_follows:
+                                    try:
+                                        self._known_follows[username] = self._take_count(counts, username)
+                                        print(f"New user added - Initial following count for {username}: {self._known_follows[username]}")
                                         self._consecutive_errors = 0
-                                    continue
+                                        continue
+                                    except Exception as e:
+                                        print(f"Failed to get initial count for new user {username}: {str(e)}")
+                                        self._consecutive_errors += 1
+                                        if self._consecutive_errors >= self._max_consecutive_errors:
+                                            driver = self._restart_driver(driver)
+                                            self._consecutive_errors = 0
+                                        continue
 
-                            current_follows = self._get_following(driver, username)
+                                current_follows = self._take_count(counts, username)
 
-                            if current_follows > self._known_follows[username]:
-                                latest_follow = self._get_latest_follow(driver, username)
-                                if latest_follow:
-                                    self.notifier.notify(
-                                        f"@{username} started following @{latest_follow}"
-                                    )
-                                else:
-                                    self.notifier.notify(
-                                        f"@{username} started following {current_follows - self._known_follows[username]} new account(s). "
+                                if current_follows > self._known_follows[username]:
+                                    latest_follow = self._get_latest_follow(driver, username)
+                                    if latest_follow:
+                                        self._notify_subscribers(
+                                            username,
+                                            f"@{username} started following @{latest_follow}"
+                                        )
+                                    else:
+                                        self._notify_subscribers(
+                                            username,
+                                            f"@{username} started following {current_follows - self._known_follows[username]} new account(s). "
+                                            f"Total following: {current_follows}"
+                                        )
+                                elif current_follows < self._known_follows[username]:
+                                    self._notify_subscribers(
+                                        username,
+                                        f"@{username} unfollowed {self._known_follows[username] - current_follows} account(s). "
                                         f"Total following: {current_follows}"
                                     )
-                            elif current_follows < self._known_follows[username]:
-                                self.notifier.notify(
-                                    f"@{username} unfollowed {self._known_follows[username] - current_follows} account(s). "
-                                    f"Total following: {current_follows}"
-                                )
                             
-                            self._known_follows[username] = current_follows
-                            self.db_manager.update_follower_count(username, current_follows)
-                            self._consecutive_errors = 0
-
-                        except Exception as e:
-                            print(f"Error monitoring {username}: {str(e)} failed attempts {self._consecutive_errors + 1}")
-                            self._consecutive_errors += 1
-                            if self._consecutive_errors >= self._max_consecutive_errors:
-                                driver = self._restart_driver(driver)
+                                self._known_follows[username] = current_follows
+                                self.db_manager.update_follower_count(username, current_follows)
                                 self._consecutive_errors = 0
-                            continue
+
+                            except Exception as e:
+                                print(f"Error monitoring {username}: {str(e)} failed attempts {self._consecutive_errors + 1}")
+                                self._consecutive_errors += 1
+                                if self._consecutive_errors >= self._max_consecutive_errors:
+                                    driver = self._restart_driver(driver)
+                                    self._consecutive_errors = 0
+                                continue
                     
                 except Exception as e:
                     #self.notifier.notify(f"Error in monitoring loop: {str(e)}")
@@ -0,0 +1,85 @@
+import math
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from .database import (
+    ChangeEvent,
+    DatabaseManager,
+    FOLLOWING_CHANGED,
+    SUBSCRIPTIONS_CHANGED,
+    USER_REMOVED
+)
+
+
+class ChatUsersView:
+
+    def __init__(self, users: Set[str], page_size: int) -> None:
+        self.users = frozenset(users)
+        self.sorted_users: List[str] = sorted(users, key=str.lower)
+        self.page_size = page_size
+        self.total_pages = max(1, math.ceil(len(self.sorted_users) / page_size))
+        self._pages: Dict[int, str] = {}
+
+    def render_page(self, page: int) -> str:
+        page = min(max(page, 0), self.total_pages - 1)
+        text = self._pages.get(page)
+        if text is None:
+            start = page * self.page_size
+            user_list = "\n".join(
+                f"@{user}" for user in self.sorted_users[start:start + self.page_size]
+            )
+            header = f"Monitored users ({len(self.sorted_users)})"
+            if self.total_pages > 1:
+                header += f", page {page + 1}/{self.total_pages}"
+            text = f"{header}:\n{user_list}"
+            self._pages[page] = text
+        return text
+
+
+class UserReadModel:
+
+    def __init__(self, db_manager: DatabaseManager, page_size: int = 50) -> None:
+        self.db_manager = db_manager
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._chat_views: Dict[int, ChatUsersView] = {}
+        self._following_counts: Optional[Dict[str, Optional[int]]] = None
+        db_manager.add_change_listener(self.invalidate)
+
+    def invalidate(self, event: ChangeEvent) -> None:
+        with self._lock:
+            if event.kind == SUBSCRIPTIONS_CHANGED:
+                self._chat_views.pop(event.chat_id, None)
+            elif event.kind == USER_REMOVED:
+                if self._following_counts is not None:
+                    self._following_counts.pop(event.username, None)
+            elif event.kind == FOLLOWING_CHANGED:
+                if self._following_counts is not None:
+                    self._following_counts[event.username] = event.count
+
+    def _get_following_counts(self) -> Dict[str, Optional[int]]:
+        with self._lock:
+            if self._following_counts is None:
+                self._following_counts = self.db_manager.get_all_following_counts()
+            return self._following_counts
+
+    def get_chat_view(self, chat_id: int) -> ChatUsersView:
+        with self._lock:
+            view = self._chat_views.get(chat_id)
+            if view is None:
+                view = ChatUsersView(set(self.db_manager.get_chat_users(chat_id)), self.page_size)
+                self._chat_views[chat_id] = view
+            return view
+
+    def is_subscribed(self, chat_id: int, username: str) -> bool:
+        return username in self.get_chat_view(chat_id).users
+
+    def render_user_list(self, chat_id: int, page: int = 0) -> Tuple[Optional[str], int, int]:
+        view = self.get_chat_view(chat_id)
+        if not view.users:
+            return None, 0, 0
+        page = min(max(page, 0), view.total_pages - 1)
+        return view.render_page(page), page, view.total_pages
+
+    def get_following_count(self, username: str) -> Optional[int]:
+        return self._get_following_counts().get(username)
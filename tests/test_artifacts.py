@@ -0,0 +1,84 @@
+import gzip
+
+import pytest
+
+from src.twitter_follower_monitor.artifacts import ArtifactRecorder
+
+
+def _page_source(calls: list, content: str = "<html></html>"):
+    def source() -> str:
+        calls.append(1)
+        return content
+    return source
+
+
+@pytest.fixture
+def recorder(tmp_path) -> ArtifactRecorder:
+    return ArtifactRecorder(
+        enabled=True,
+        directory=str(tmp_path / "artifacts"),
+        max_files=3,
+        max_bytes=16,
+        min_failure_interval=0.0
+    )
+
+
+def test_disabled_recorder_never_fetches(tmp_path) -> None:
+    calls: list = []
+    recorder = ArtifactRecorder(directory=str(tmp_path / "artifacts"), sample_rate=1.0)
+
+    recorder.capture_failure("login_failed_page", _page_source(calls))
+    recorder.capture_stage("login_page_initial", _page_source(calls))
+
+    assert calls == []
+    assert not (tmp_path / "artifacts").exists()
+
+
+def test_failure_written_compressed_truncated_and_sanitised(recorder: ArtifactRecorder) -> None:
+    recorder.capture_failure("following_failed_../../evil", _page_source([], "x" * 100))
+    recorder._queue.join()
+
+    [path] = recorder.directory.iterdir()
+    assert path.name.endswith("_following_failed_______evil.html.gz")
+    with gzip.open(path) as f:
+        assert f.read() == b"x" * 16
+
+
+def test_ring_keeps_newest_files(recorder: ArtifactRecorder) -> None:
+    for i in range(5):
+        recorder.capture_failure(f"failure_{i}", _page_source([]))
+        recorder._queue.join()
+
+    names = sorted(path.name for path in recorder.directory.iterdir())
+    assert len(names) == 3
+    assert [name.rsplit("_", 1)[-1] for name in names] == ["2.html.gz", "3.html.gz", "4.html.gz"]
+
+
+def test_failure_cooldown_per_name(recorder: ArtifactRecorder) -> None:
+    calls: list = []
+
+    recorder.capture_failure("following_failed_alice", _page_source(calls))
+    recorder.capture_failure("following_failed_alice", _page_source(calls))
+    recorder.capture_failure("following_failed_bob", _page_source(calls))
+
+    assert len(calls) == 2
+
+
+def test_min_failure_interval_across_names(tmp_path) -> None:
+    calls: list = []
+    recorder = ArtifactRecorder(enabled=True, directory=str(tmp_path / "artifacts"))
+
+    recorder.capture_failure("following_failed_alice", _page_source(calls))
+    recorder.capture_failure("following_failed_bob", _page_source(calls))
+
+    assert len(calls) == 1
+
+
+def test_full_queue_skips_page_source_fetch(recorder: ArtifactRecorder) -> None:
+    calls: list = []
+    recorder._queue = type(recorder._queue)(maxsize=1)
+    recorder._queue.put_nowait(("pending", ""))
+
+    recorder.capture_failure("login_failed_page", _page_source(calls))
+
+    assert calls == []
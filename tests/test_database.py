@@ -0,0 +1,122 @@
+import sqlite3
+import pytest
+
+from src.twitter_follower_monitor.database import (
+    ChangeEvent,
+    DatabaseManager,
+    FOLLOWING_CHANGED,
+    SUBSCRIPTIONS_CHANGED,
+    USER_REMOVED
+)
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    return str(tmp_path / "twitter_monitor.db")
+
+
+@pytest.fixture
+def db(db_path) -> DatabaseManager:
+    return DatabaseManager(db_path)
+
+
+def test_subscribe_updates_reverse_index(db: DatabaseManager) -> None:
+    db.subscribe(1, "alice")
+    db.subscribe(2, "Alice")
+    db.subscribe(2, "bob")
+
+    assert db.get_subscribers("alice") == {1, 2}
+    assert db.get_subscribers("ALICE") == {1, 2}
+    assert db.get_subscribers("bob") == {2}
+    assert sorted(db.get_chat_users(2)) == ["alice", "bob"]
+    assert sorted(db.get_all_users()) == ["alice", "bob"]
+
+
+def test_unsubscribe_keeps_user_while_other_chats_watch(db: DatabaseManager) -> None:
+    db.subscribe(1, "alice")
+    db.subscribe(2, "alice")
+
+    db.unsubscribe(1, "Alice")
+
+    assert db.get_subscribers("alice") == {2}
+    assert db.get_all_users() == ["alice"]
+
+
+def test_unsubscribe_last_chat_removes_monitored_user(db: DatabaseManager) -> None:
+    db.subscribe(1, "alice")
+
+    db.unsubscribe(1, "alice")
+
+    assert db.get_subscribers("alice") == set()
+    assert db.get_all_users() == []
+
+
+def test_subscriptions_reload_from_disk(db: DatabaseManager, db_path: str) -> None:
+    db.subscribe(1, "alice")
+    db.subscribe(2, "alice")
+
+    assert DatabaseManager(db_path).get_subscribers("alice") == {1, 2}
+
+
+def test_subscribe_orphaned_users(db_path: str) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE monitored_users (username TEXT PRIMARY KEY, following_count INTEGER, "
+            "last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("INSERT INTO monitored_users (username) VALUES ('legacy')")
+    db = DatabaseManager(db_path)
+    db.subscribe(2, "watched")
+
+    assert db.subscribe_orphaned_users(1) == ["legacy"]
+    assert db.get_subscribers("legacy") == {1}
+    assert db.get_subscribers("watched") == {2}
+    assert db.subscribe_orphaned_users(3) == []
+
+
+def test_migration_folds_mixed_case_usernames_keeping_counts(db_path: str) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE monitored_users (username TEXT PRIMARY KEY, following_count INTEGER, "
+            "last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.executemany(
+            "INSERT INTO monitored_users (username, following_count) VALUES (?, ?)",
+            [("Foo", 10), ("foo", None), ("Bar", 3), ("baz", 5), ("BAZ", 7)]
+        )
+
+    db = DatabaseManager(db_path)
+
+    assert db.get_all_following_counts() == {"foo": 10, "bar": 3, "baz": 5}
+
+
+def test_update_follower_count_notifies_only_on_change(db: DatabaseManager) -> None:
+    events: List[ChangeEvent] = []
+    db.subscribe(1, "alice")
+    db.add_change_listener(events.append)
+
+    db.update_follower_count("alice", 10)
+    db.update_follower_count("alice", 10)
+    db.update_follower_count("alice", 11)
+
+    assert events == [
+        ChangeEvent(FOLLOWING_CHANGED, username="alice", count=10),
+        ChangeEvent(FOLLOWING_CHANGED, username="alice", count=11)
+    ]
+    assert db.get_following_count("alice") == 11
+
+
+def test_unsubscribe_events(db: DatabaseManager) -> None:
+    events: List[ChangeEvent] = []
+    db.subscribe(1, "alice")
+    db.subscribe(2, "alice")
+    db.add_change_listener(events.append)
+
+    db.unsubscribe(1, "alice")
+    db.unsubscribe(2, "alice")
+
+    assert events == [
+        ChangeEvent(SUBSCRIPTIONS_CHANGED, chat_id=1, username="alice"),
+        ChangeEvent(SUBSCRIPTIONS_CHANGED, chat_id=2, username="alice"),
+        ChangeEvent(USER_REMOVED, username="alice")
+    ]
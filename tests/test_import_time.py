@@ -0,0 +1,84 @@
+import importlib.util
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cold-start budgets for importing the bot module, measured with -X importtime
+# on CPython 3.11:
+# - telegram stubbed out: 0.06-0.09s cumulative, budget 0.3s
+# - python-telegram-bot 22.8: 0.20-0.35s cumulative, budget 0.6s
+BOT_IMPORT_BUDGET_SECONDS = 0.3
+BOT_IMPORT_WITH_TELEGRAM_BUDGET_SECONDS = 0.6
+
+STUB_TELEGRAM = textwrap.dedent("""
+    import sys
+    import types
+
+    class _StubType(type):
+        def __getattr__(cls, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return cls
+
+    class _StubModule(types.ModuleType):
+        def __getattr__(self, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            stub = _StubType(name, (Exception,), {})
+            setattr(self, name, stub)
+            return stub
+
+    for name in ("telegram", "telegram.ext", "telegram.error"):
+        sys.modules[name] = _StubModule(name)
+""")
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+def test_bot_import_does_not_load_scraping_backend() -> None:
+    result = _run(STUB_TELEGRAM + textwrap.dedent("""
+        import src.twitter_follower_monitor.bot
+        loaded = [m for m in ("selenium", "bs4", "psutil") if m in sys.modules]
+        print(",".join(loaded))
+    """))
+
+    assert result.stdout.strip() == ""
+
+
+def _bot_import_seconds(prelude: str = "") -> float:
+    result = _run(prelude + "import src.twitter_follower_monitor.bot", "-X", "importtime")
+
+    # -X importtime lines look like "import time: self | cumulative | module".
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "src.twitter_follower_monitor.bot":
+            cumulative_us = int(parts[1])
+
+    assert cumulative_us is not None
+    return cumulative_us / 1_000_000
+
+
+def test_bot_import_time_within_budget() -> None:
+    assert _bot_import_seconds(STUB_TELEGRAM) < BOT_IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("telegram") is None,
+    reason="python-telegram-bot is not installed"
+)
+def test_bot_import_time_with_telegram_within_budget() -> None:
+    assert _bot_import_seconds() < BOT_IMPORT_WITH_TELEGRAM_BUDGET_SECONDS
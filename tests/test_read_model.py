@@ -0,0 +1,77 @@
+import pytest
+
+from src.twitter_follower_monitor.database import DatabaseManager
+from src.twitter_follower_monitor.read_model import UserReadModel
+
+
+@pytest.fixture
+def db(tmp_path) -> DatabaseManager:
+    return DatabaseManager(str(tmp_path / "twitter_monitor.db"))
+
+
+@pytest.fixture
+def read_model(db: DatabaseManager) -> UserReadModel:
+    return UserReadModel(db, page_size=2)
+
+
+def test_chat_view_follows_subscriptions(db: DatabaseManager, read_model: UserReadModel) -> None:
+    db.subscribe(1, "alice")
+    assert read_model.is_subscribed(1, "alice")
+    assert not read_model.is_subscribed(1, "bob")
+
+    db.subscribe(1, "bob")
+    assert read_model.is_subscribed(1, "bob")
+
+    db.unsubscribe(1, "alice")
+    assert not read_model.is_subscribed(1, "alice")
+
+
+def test_subscription_change_only_drops_that_chat(db: DatabaseManager, read_model: UserReadModel) -> None:
+    db.subscribe(1, "alice")
+    db.subscribe(2, "bob")
+    other_view = read_model.get_chat_view(2)
+
+    db.subscribe(1, "carol")
+
+    assert read_model.get_chat_view(2) is other_view
+    assert read_model.get_chat_view(1).users == {"alice", "carol"}
+
+
+def test_following_count_updated_in_place(db: DatabaseManager, read_model: UserReadModel, monkeypatch) -> None:
+    db.subscribe(1, "alice")
+    assert read_model.get_following_count("alice") is None
+
+    def fail_full_reload():
+        raise AssertionError("following counts reloaded from the database")
+
+    monkeypatch.setattr(db, "get_all_following_counts", fail_full_reload)
+    db.update_follower_count("alice", 10)
+    db.update_follower_count("alice", 10)
+
+    assert read_model.get_following_count("alice") == 10
+
+
+def test_removed_user_evicted_from_counts(db: DatabaseManager, read_model: UserReadModel) -> None:
+    db.subscribe(1, "alice")
+    db.update_follower_count("alice", 10)
+    assert read_model.get_following_count("alice") == 10
+
+    db.unsubscribe(1, "alice")
+
+    assert read_model.get_following_count("alice") is None
+
+
+def test_render_user_list_pages_and_clamps(db: DatabaseManager, read_model: UserReadModel) -> None:
+    for username in ("carol", "alice", "bob"):
+        db.subscribe(1, username)
+
+    assert read_model.render_user_list(1) == ("Monitored users (3), page 1/2:\n@alice\n@bob", 0, 2)
+    assert read_model.render_user_list(1, 5) == ("Monitored users (3), page 2/2:\n@carol", 1, 2)
+    assert read_model.render_user_list(1, -1)[1] == 0
+    assert read_model.render_user_list(2) == (None, 0, 0)
+
+
+def test_single_page_has_no_page_counter(db: DatabaseManager, read_model: UserReadModel) -> None:
+    db.subscribe(1, "alice")
+
+    assert read_model.render_user_list(1) == ("Monitored users (1):\n@alice", 0, 1)